@@ -25,7 +25,10 @@ st.markdown(
 """
 )
 
-st.info("Use the sidebar to navigate: **Home** → **Results**.", icon="ℹ️")
+st.info(
+    "Use the sidebar to navigate: **Home** → **Results** (or **Compare** for client + competitors).",
+    icon="ℹ️",
+)
 
 with st.expander("Dev notes", expanded=False):
     st.write(
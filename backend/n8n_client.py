@@ -1,21 +1,11 @@
 import os
 import requests
 from typing import Any, Dict
+from urllib.parse import urlparse
 
 
-def call_n8n_generate_ads(
-    scraped_text: str,
-    image_urls: list[str],
-    url: str,
-    *,
-    webhook_url: str | None = None,
-) -> dict:
-    """
-    Sends scraped content to an n8n webhook.
-    For now, send a very simple payload and don't try to be clever.
-    """
-
-    # 1) Decide URL: prefer explicit argument, else env var, else TEST endpoint
+def _resolve_webhook_url(webhook_url: str | None) -> str:
+    # Decide URL: prefer explicit argument, else env var, else TEST endpoint
     if webhook_url:
         target_url = webhook_url
     else:
@@ -24,33 +14,39 @@ def call_n8n_generate_ads(
             or "https://fpgconsulting.app.n8n.cloud/webhook-test/generate-ads"
         )
 
-    # Hard fail if URL isn't exactly what we expect (prevents "posting to nowhere")
-    if not isinstance(target_url, str) or not target_url.startswith("https://") or "/webhook" not in target_url:
+    # Hard fail if URL isn't exactly what we expect (prevents "posting to nowhere").
+    # Plain http is only allowed for a local mock server (see backend/n8n_mock.py).
+    # Parse rather than prefix-match: "http://localhost@evil.com" must not pass.
+    is_local_mock = False
+    if isinstance(target_url, str):
+        parsed = urlparse(target_url)
+        is_local_mock = (
+            parsed.scheme == "http"
+            and parsed.hostname in {"127.0.0.1", "localhost"}
+            and parsed.username is None
+            and parsed.password is None
+        )
+    if (
+        not isinstance(target_url, str)
+        or not (target_url.startswith("https://") or is_local_mock)
+        or "/webhook" not in target_url
+    ):
         raise RuntimeError(f"Invalid n8n webhook URL: {repr(target_url)}")
 
+    return target_url
+
+
+def _post_to_n8n(target_url: str, payload: dict, *, timeout: tuple[float, float]) -> dict:
     # Mirror Tender / Echo pattern: secret optional but supported
     webhook_secret = os.getenv("WEBHOOK_SECRET", "")
 
-    # 2) Build a flat, boring payload
-    payload = {
-        "payload_type": "smb_ad_agent_test",
-        "url": url,
-        # IMPORTANT: match what SMB_scrape.json references in n8n ({{$json.scraped_text}})
-        # Keep it bounded to avoid huge payloads while debugging.
-        "scraped_text": (scraped_text or "")[:20000],
-        "scraped_text_len": len(scraped_text or ""),
-        "image_count": len(image_urls or []),
-        "image_urls": image_urls or [],
-        "sample_text": (scraped_text or "")[:500],  # keep for quick inspection
-    }
-
     # EXACT Tender-style headers (no Accept)
     headers = {"Content-Type": "application/json"}
     if webhook_secret:
         headers["X-Webhook-Secret"] = webhook_secret
 
     # EXACT Tender-style timeout shape: (connect, read)
-    req_timeout = (10, 60)
+    req_timeout = timeout
     resp = requests.post(target_url, headers=headers, json=payload, timeout=req_timeout)
 
     # Build result with debug fields first
@@ -82,3 +78,75 @@ def call_n8n_generate_ads(
         pass
 
     return result
+
+
+def call_n8n_generate_ads(
+    scraped_text: str,
+    image_urls: list[str],
+    url: str,
+    *,
+    webhook_url: str | None = None,
+    timeout: tuple[float, float] = (10, 60),
+) -> dict:
+    """
+    Sends scraped content to an n8n webhook.
+    For now, send a very simple payload and don't try to be clever.
+    """
+
+    target_url = _resolve_webhook_url(webhook_url)
+
+    # Build a flat, boring payload
+    payload = {
+        "payload_type": "smb_ad_agent_test",
+        "url": url,
+        # IMPORTANT: match what SMB_scrape.json references in n8n ({{$json.scraped_text}})
+        # Keep it bounded to avoid huge payloads while debugging.
+        "scraped_text": (scraped_text or "")[:20000],
+        "scraped_text_len": len(scraped_text or ""),
+        "image_count": len(image_urls or []),
+        "image_urls": image_urls or [],
+        "sample_text": (scraped_text or "")[:500],  # keep for quick inspection
+    }
+
+    return _post_to_n8n(target_url, payload, timeout=timeout)
+
+
+def call_n8n_compare_sites(
+    sites: list[dict],
+    *,
+    webhook_url: str | None = None,
+    timeout: tuple[float, float] = (10, 60),
+) -> dict:
+    """
+    Sends several scraped sites to n8n in ONE payload (client + competitors).
+    sites: [{"url", "scraped_text", "image_urls", "error"}, ...]; first entry is the client.
+    """
+
+    target_url = _resolve_webhook_url(webhook_url)
+
+    # One section per site, same bounded fields as the single-site payload
+    sections = []
+    for i, site in enumerate(sites):
+        text = site.get("scraped_text") or ""
+        images = site.get("image_urls") or []
+        sections.append(
+            {
+                "role": "client" if i == 0 else "competitor",
+                "url": site.get("url", ""),
+                "scraped_text": text[:20000],
+                "scraped_text_len": len(text),
+                "image_count": len(images),
+                "image_urls": images,
+                "sample_text": text[:500],
+                "error": site.get("error") or "",
+            }
+        )
+
+    payload = {
+        "payload_type": "smb_ad_agent_compare",
+        "url": sections[0]["url"] if sections else "",
+        "site_count": len(sections),
+        "sites": sections,
+    }
+
+    return _post_to_n8n(target_url, payload, timeout=timeout)
@@ -0,0 +1,292 @@
+"""
+Load-test harness for the n8n dispatch path (call_n8n_generate_ads).
+
+Drives the real client at a target concurrency against a local mock webhook
+(backend/n8n_mock.py) and reports throughput, latency percentiles, an error
+breakdown and memory use. The mock runs in-process, so memory figures include
+its response buffers (an upper bound for the client alone). Example:
+
+    python -m backend.n8n_loadtest --concurrency 1,10,50 --requests 200 \\
+        --latency-dist lognormal --latency-mean 2 --latency-spread 0.6 \\
+        --rate-limit-rate 0.05 --error-rate 0.02 --read-timeout 5
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import math
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import requests
+
+from backend.n8n_client import call_n8n_generate_ads
+from backend.n8n_mock import LATENCY_DISTS, MockConfig, MockN8nServer
+
+try:
+    import resource  # POSIX only
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+# 200 responses at or above this size are counted as "ok_oversized"
+DEFAULT_OVERSIZE_THRESHOLD_BYTES = 1_000_000
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    # Nearest-rank; good enough for sizing decisions
+    idx = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[idx]
+
+
+@dataclass
+class LoadTestReport:
+    concurrency: int
+    total_requests: int
+    wall_time_s: float
+    latencies_s: list[float] = field(default_factory=list)
+    outcomes: Counter = field(default_factory=Counter)
+    response_bytes: list[int] = field(default_factory=list)
+    peak_traced_mb: float | None = None
+    max_rss_mb: float | None = None
+
+    @property
+    def throughput_rps(self) -> float:
+        return self.total_requests / self.wall_time_s if self.wall_time_s else 0.0
+
+    def percentile(self, pct: float) -> float:
+        return _percentile(self.latencies_s, pct)
+
+    def size_percentile(self, pct: float) -> float:
+        return _percentile(self.response_bytes, pct)
+
+
+def response_size(result: dict) -> int | None:
+    # The client only keeps a text snippet, so rely on the declared Content-Length
+    for k, v in (result.get("_debug_resp_headers") or {}).items():
+        if k.lower() == "content-length":
+            try:
+                return int(v)
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+def classify_result(result: dict, *, oversize_threshold_bytes: int = DEFAULT_OVERSIZE_THRESHOLD_BYTES) -> str:
+    status = result.get("_debug_http_status")
+    if status == 200:
+        size = response_size(result)
+        if size is not None and size >= oversize_threshold_bytes:
+            return "ok_oversized"
+        return "ok"
+    if status == 429:
+        return "http_429"
+    if isinstance(status, int) and status >= 500:
+        return "http_5xx"
+    return f"http_{status}"
+
+
+def classify_exception(exc: BaseException) -> str:
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return "connect_timeout"
+    if isinstance(exc, requests.exceptions.ReadTimeout):
+        return "read_timeout"
+    if isinstance(exc, requests.exceptions.ConnectionError):
+        return "connection_error"
+    return type(exc).__name__
+
+
+def _max_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    # Process-wide high-water mark, not per level: it never goes down during a sweep.
+    # ru_maxrss is KiB on Linux (bytes on macOS, close enough for a sanity check)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_load(
+    webhook_url: str,
+    *,
+    concurrency: int,
+    total_requests: int,
+    timeout: tuple[float, float] = (10, 60),
+    text_chars: int = 20000,
+    image_count: int = 12,
+    trace_memory: bool = True,
+    oversize_threshold_bytes: int = DEFAULT_OVERSIZE_THRESHOLD_BYTES,
+) -> LoadTestReport:
+    """
+    Fire total_requests calls through call_n8n_generate_ads using a pool of
+    `concurrency` worker threads (one per simulated Streamlit session).
+    """
+    scraped_text = ("Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * (text_chars // 57 + 1))[:text_chars]
+    image_urls = [f"https://example.com/img/{i}.jpg" for i in range(image_count)]
+
+    latencies: list[float] = []
+    outcomes: Counter = Counter()
+    sizes: list[int] = []
+    lock = threading.Lock()
+
+    def one_call(i: int) -> None:
+        started = time.perf_counter()
+        size = None
+        try:
+            result = call_n8n_generate_ads(
+                scraped_text=scraped_text,
+                image_urls=image_urls,
+                url=f"https://example.com/site/{i}",
+                webhook_url=webhook_url,
+                timeout=timeout,
+            )
+            outcome = classify_result(result, oversize_threshold_bytes=oversize_threshold_bytes)
+            size = response_size(result)
+        except Exception as e:
+            outcome = classify_exception(e)
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies.append(elapsed)
+            outcomes[outcome] += 1
+            if size is not None:
+                sizes.append(size)
+
+    gc.collect()
+    if trace_memory:
+        tracemalloc.start()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one_call, range(total_requests)))
+    wall = time.perf_counter() - started
+
+    peak_mb = None
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_mb = peak / (1024 * 1024)
+
+    return LoadTestReport(
+        concurrency=concurrency,
+        total_requests=total_requests,
+        wall_time_s=wall,
+        latencies_s=latencies,
+        outcomes=outcomes,
+        response_bytes=sizes,
+        peak_traced_mb=peak_mb,
+        max_rss_mb=_max_rss_mb(),
+    )
+
+
+def format_report(report: LoadTestReport) -> str:
+    lines = [
+        f"concurrency={report.concurrency} requests={report.total_requests} "
+        f"wall={report.wall_time_s:.2f}s throughput={report.throughput_rps:.2f} req/s",
+        "  latency s: "
+        + " ".join(f"p{p}={report.percentile(p):.3f}" for p in (50, 90, 95, 99))
+        + f" max={max(report.latencies_s, default=0.0):.3f}",
+        "  outcomes: " + ", ".join(f"{k}={v}" for k, v in sorted(report.outcomes.items())),
+    ]
+    if report.response_bytes:
+        lines.append(
+            "  response KB: "
+            + " ".join(f"p{p}={report.size_percentile(p) / 1024:.1f}" for p in (50, 95, 99))
+            + f" max={max(report.response_bytes) / 1024:.1f}"
+        )
+    mem = []
+    if report.peak_traced_mb is not None:
+        mem.append(f"peak_traced={report.peak_traced_mb:.1f}MB (this level)")
+    if report.max_rss_mb is not None:
+        mem.append(f"process_max_rss={report.max_rss_mb:.1f}MB (high-water mark so far)")
+    if mem:
+        lines.append("  memory: " + " ".join(mem))
+    return "\n".join(lines)
+
+
+def _concurrency_levels(value: str) -> list[int]:
+    try:
+        levels = [int(c) for c in value.split(",") if c.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected integers, got {value!r}")
+    if not levels or any(level < 1 for level in levels):
+        raise argparse.ArgumentTypeError(f"concurrency levels must be >= 1, got {value!r}")
+    return levels
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+
+    load = p.add_argument_group("load")
+    load.add_argument("--concurrency", type=_concurrency_levels, default="10", help="Worker count, or comma list to sweep (e.g. 1,10,50)")
+    load.add_argument("--requests", type=int, default=100, help="Requests per concurrency level")
+    load.add_argument("--connect-timeout", type=float, default=10.0)
+    load.add_argument("--read-timeout", type=float, default=60.0)
+    load.add_argument("--text-chars", type=int, default=20000, help="Size of synthetic scraped_text")
+    load.add_argument(
+        "--oversize-threshold",
+        type=int,
+        default=DEFAULT_OVERSIZE_THRESHOLD_BYTES,
+        help="200 responses with at least this many bytes count as ok_oversized",
+    )
+    load.add_argument("--no-tracemalloc", action="store_true", help="Skip tracemalloc (lower overhead)")
+    load.add_argument(
+        "--webhook-url",
+        default=None,
+        help="Target an existing webhook instead of starting the local mock (mock flags are ignored)",
+    )
+
+    mock = p.add_argument_group("mock server")
+    mock.add_argument("--latency-dist", choices=LATENCY_DISTS, default="fixed")
+    mock.add_argument("--latency-mean", type=float, default=0.2, help="Seconds (median for lognormal)")
+    mock.add_argument("--latency-spread", type=float, default=0.05, help="Seconds; sigma of log for lognormal")
+    mock.add_argument("--error-rate", type=float, default=0.0, help="Fraction of HTTP 500 responses")
+    mock.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of HTTP 429 responses")
+    mock.add_argument("--oversize-rate", type=float, default=0.0, help="Fraction of oversized 200 responses")
+    mock.add_argument("--oversize-bytes", type=int, default=5_000_000)
+    mock.add_argument("--seed", type=int, default=None)
+    return p.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    levels = args.concurrency
+    timeout = (args.connect_timeout, args.read_timeout)
+
+    def sweep(webhook_url: str) -> None:
+        print(f"Target: {webhook_url} timeout={timeout}")
+        for level in levels:
+            report = run_load(
+                webhook_url,
+                concurrency=level,
+                total_requests=args.requests,
+                timeout=timeout,
+                text_chars=args.text_chars,
+                trace_memory=not args.no_tracemalloc,
+                oversize_threshold_bytes=args.oversize_threshold,
+            )
+            print(format_report(report))
+
+    if args.webhook_url:
+        sweep(args.webhook_url)
+        return
+
+    config = MockConfig(
+        latency_dist=args.latency_dist,
+        latency_mean_s=args.latency_mean,
+        latency_spread_s=args.latency_spread,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        oversize_rate=args.oversize_rate,
+        oversize_bytes=args.oversize_bytes,
+        seed=args.seed,
+    )
+    with MockN8nServer(config) as server:
+        sweep(server.webhook_url)
+
+
+if __name__ == "__main__":
+    main()
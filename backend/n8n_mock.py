@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import json
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Same path as the real Webhook node, so call_n8n_generate_ads accepts the URL
+MOCK_WEBHOOK_PATH = "/webhook-test/generate-ads"
+
+LATENCY_DISTS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+
+@dataclass(frozen=True)
+class MockConfig:
+    latency_dist: str = "fixed"  # fixed | uniform | normal | lognormal | exponential
+    latency_mean_s: float = 0.2
+    latency_spread_s: float = 0.05  # half-width (uniform), stddev (normal/lognormal)
+    error_rate: float = 0.0  # fraction answered with HTTP 500
+    rate_limit_rate: float = 0.0  # fraction answered with HTTP 429
+    oversize_rate: float = 0.0  # fraction answered with an oversized 200 body
+    oversize_bytes: int = 5_000_000
+    seed: int | None = None
+
+
+def sample_latency(cfg: MockConfig, rng: random.Random) -> float:
+    mean = max(cfg.latency_mean_s, 0.0)
+    spread = max(cfg.latency_spread_s, 0.0)
+
+    if cfg.latency_dist == "fixed":
+        value = mean
+    elif cfg.latency_dist == "uniform":
+        value = rng.uniform(mean - spread, mean + spread)
+    elif cfg.latency_dist == "normal":
+        value = rng.gauss(mean, spread)
+    elif cfg.latency_dist == "lognormal":
+        # Parametrise by the median so "mean" stays readable; spread is sigma of log
+        value = mean * rng.lognormvariate(0.0, spread) if mean else 0.0
+    elif cfg.latency_dist == "exponential":
+        value = rng.expovariate(1.0 / mean) if mean else 0.0
+    else:
+        raise ValueError(f"Unknown latency distribution: {cfg.latency_dist!r}")
+
+    return max(value, 0.0)
+
+
+def _make_handler(cfg: MockConfig, rng: random.Random, lock: threading.Lock):
+    class MockN8nHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):  # noqa: A002 - stdlib signature
+            # Keep load-test output readable
+            pass
+
+        def _send(self, status: int, body: bytes, extra_headers: dict | None = None) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for k, v in (extra_headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+
+            if "/webhook" not in self.path:
+                self._send(404, b'{"message": "webhook not registered"}')
+                return
+
+            # One draw per request from the shared RNG (seeded runs are repeatable)
+            with lock:
+                delay = sample_latency(cfg, rng)
+                roll = rng.random()
+
+            # Rate limiting is answered at the edge, before the workflow runs
+            if roll < cfg.rate_limit_rate:
+                self._send(429, b'{"message": "Too Many Requests"}', {"Retry-After": "1"})
+                return
+            roll -= cfg.rate_limit_rate
+
+            time.sleep(delay)
+
+            if roll < cfg.error_rate:
+                self._send(500, b'{"message": "Error in workflow"}')
+                return
+            roll -= cfg.error_rate
+
+            if roll < cfg.oversize_rate:
+                filler = "x" * max(cfg.oversize_bytes, 0)
+                self._send(200, json.dumps({"ok": True, "filler": filler}).encode("utf-8"))
+                return
+
+            try:
+                payload = json.loads(raw or b"{}")
+            except ValueError:
+                payload = {}
+            body = {
+                "ok": True,
+                "url": payload.get("url", ""),
+                "scraped_text_len": payload.get("scraped_text_len", 0),
+                "business_summary": "Mock summary",
+                "poster_concepts": [
+                    {"headline": "Mock headline", "subhead": "Mock subhead", "cta": "Learn more"}
+                ],
+            }
+            self._send(200, json.dumps(body).encode("utf-8"))
+
+    return MockN8nHandler
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Default backlog (5) drops connections long before the client saturates
+    request_queue_size = 1024
+
+    def handle_error(self, request, client_address):
+        # Client-side timeouts hang up mid-response; that's expected under load
+        if isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            return
+        super().handle_error(request, client_address)
+
+
+class MockN8nServer:
+    """
+    Local stand-in for the n8n webhook, for load testing call_n8n_generate_ads.
+    Runs a threaded HTTP server in the background; use as a context manager.
+    """
+
+    def __init__(self, config: MockConfig | None = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or MockConfig()
+        if self.config.latency_dist not in LATENCY_DISTS:
+            raise ValueError(f"Unknown latency distribution: {self.config.latency_dist!r}")
+
+        handler = _make_handler(self.config, random.Random(self.config.seed), threading.Lock())
+        self._httpd = _MockHTTPServer((host, port), handler)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def webhook_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{MOCK_WEBHOOK_PATH}"
+
+    def start(self) -> "MockN8nServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "MockN8nServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, Iterator
 from urllib.parse import urljoin, urlparse
 
 import requests
@@ -220,3 +221,34 @@ def scrape_site(
         text=combined_text,
         image_urls=all_images,
     )
+
+
+def scrape_sites(
+    start_urls: Iterable[str],
+    *,
+    max_workers: int = 6,
+    **scrape_kwargs,
+) -> Iterator[tuple[str, ScrapeResult | Exception]]:
+    """
+    Scrape several sites in parallel through one shared thread pool.
+    Yields (start_url, ScrapeResult or the exception raised) as each site finishes,
+    so total time tracks the slowest site rather than the sum.
+    scrape_kwargs are passed through to scrape_site.
+    """
+    urls = list(dict.fromkeys(start_urls))
+    if not urls:
+        return
+
+    pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls))))
+    try:
+        futures = {pool.submit(scrape_site, u, **scrape_kwargs): u for u in urls}
+        for fut in as_completed(futures):
+            u = futures[fut]
+            try:
+                yield u, fut.result()
+            except Exception as e:
+                yield u, e
+    finally:
+        # Don't block if the caller stops early (e.g. a Streamlit rerun closes the
+        # generator): drop queued sites and let in-flight ones finish in the background.
+        pool.shutdown(wait=False, cancel_futures=True)
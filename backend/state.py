@@ -19,6 +19,12 @@ def init_state() -> None:
     st.session_state.setdefault("business_summary", "")
     st.session_state.setdefault("poster_concepts", [])
 
+    # Multi-site comparison (client first, then competitors)
+    st.session_state.setdefault("input_mode", "Single site")  # Single site | Compare sites
+    st.session_state.setdefault("target_urls", [])
+    st.session_state.setdefault("compare_status", "idle")  # idle | queued | scraped | error
+    st.session_state.setdefault("compare_results", {})  # url -> {visited_urls, scraped_text, image_urls, error}
+
     # n8n settings
     st.session_state.setdefault("n8n_mode", "TEST")  # TEST | LIVE
     # Computed URLs (no paste boxes) - always set to avoid stale/empty session values
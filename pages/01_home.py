@@ -23,6 +23,51 @@ def is_probably_valid_url(url: str) -> bool:
     return re.match(pattern, url.strip()) is not None
 
 
+# Client + up to 5 competitors, scraped in parallel on the Compare page
+MAX_COMPARE_SITES = 6
+INPUT_MODES = ["Single site", "Compare sites"]
+
+# No widget key: Streamlit drops widget state on other pages, so keep the choice
+# in our own session key and feed it back in as the default index.
+saved_mode = st.session_state.get("input_mode", INPUT_MODES[0])
+input_mode = st.radio(
+    "Input mode",
+    INPUT_MODES,
+    index=INPUT_MODES.index(saved_mode) if saved_mode in INPUT_MODES else 0,
+    horizontal=True,
+)
+st.session_state["input_mode"] = input_mode
+
+if input_mode == "Compare sites":
+    urls_text = st.text_area(
+        "Website URLs (one per line, client first, then competitors)",
+        placeholder="https://client.example.com\nhttps://competitor-a.example.com",
+        value="\n".join(st.session_state.get("target_urls", [])),
+        height=160,
+    )
+    compare_clicked = st.button("Apply", type="primary", key="apply_compare")
+
+    if compare_clicked:
+        # Keep order (first = client), drop blanks and duplicates
+        cleaned_urls = list(dict.fromkeys(u.strip() for u in urls_text.splitlines() if u.strip()))
+        invalid = [u for u in cleaned_urls if not is_probably_valid_url(u)]
+        if len(cleaned_urls) < 2:
+            st.error("Enter at least two URLs (your site plus one competitor).")
+        elif len(cleaned_urls) > MAX_COMPARE_SITES:
+            st.error(f"Enter at most {MAX_COMPARE_SITES} URLs.")
+        elif invalid:
+            st.error("These URLs must start with http:// or https://: " + ", ".join(invalid))
+        else:
+            st.session_state["target_urls"] = cleaned_urls
+            st.session_state["compare_status"] = "queued"
+            st.session_state["compare_results"] = {}
+
+            st.success("Saved. Opening Compare…")
+            st.switch_page("pages/03_compare.py")
+
+    st.stop()
+
+
 url = st.text_input(
     "Website URL",
     placeholder="https://example.com",
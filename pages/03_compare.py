@@ -0,0 +1,155 @@
+import time
+
+import streamlit as st
+
+from backend.scraper import ScrapeResult, scrape_sites
+from backend.n8n_client import call_n8n_compare_sites
+from backend.state import init_state
+
+init_state()
+
+
+st.title("3) Compare sites")
+
+target_urls = st.session_state.get("target_urls", [])
+if not target_urls:
+    st.warning("No URLs provided yet. Go to Home, choose **Compare sites** and enter your site plus competitors.")
+    st.stop()
+
+st.caption(f"Client: {target_urls[0]} · Competitors: {len(target_urls) - 1}")
+
+status = st.session_state.get("compare_status", "idle")
+
+
+def get_webhook_url() -> str:
+    mode = st.session_state.get("n8n_mode", "TEST")
+    return st.session_state["n8n_test_url"] if mode == "TEST" else st.session_state["n8n_live_url"]
+
+
+with st.sidebar:
+    st.subheader("n8n")
+    st.radio("Mode", ["TEST", "LIVE"], key="n8n_mode", horizontal=True)
+    st.caption(f"Endpoint: `{get_webhook_url()}`")
+
+    st.subheader("Run status")
+    st.write(f"**{status}**")
+
+    # One combined payload with a section per site (client first)
+    can_run_ai = status == "scraped"
+    if st.button("Run AI (n8n)", disabled=not can_run_ai):
+        results = st.session_state.get("compare_results", {})
+        sites = [{"url": u, **results.get(u, {})} for u in target_urls]
+        with st.spinner(f"Calling n8n with {len(sites)} sites…"):
+            debug_result = call_n8n_compare_sites(sites, webhook_url=get_webhook_url())
+        mode = st.session_state.get("n8n_mode", "TEST")
+        st.success(f"Sent {mode} compare payload to n8n – check Webhook node Output → JSON.")
+        with st.expander("Debug: JSON sent to n8n", expanded=True):
+            st.write("Target URL:")
+            st.code(debug_result.get("_debug_target_url", ""), language="text")
+            st.write("HTTP status / final URL:")
+            st.code(
+                f"{debug_result.get('_debug_http_status')} | final={debug_result.get('_debug_final_url')}",
+                language="text",
+            )
+            if debug_result.get("_error"):
+                st.error(debug_result.get("_error"))
+            st.write("Response text (first 400 chars):")
+            st.code(debug_result.get("_debug_resp_text_snippet", ""), language="text")
+            st.write("Payload:")
+            st.json(debug_result.get("_debug_payload_sent", {}))
+
+    if st.button("Reset"):
+        st.session_state["target_urls"] = []
+        st.session_state["compare_status"] = "idle"
+        st.session_state["compare_results"] = {}
+        st.switch_page("pages/01_home.py")
+
+
+if status == "queued":
+    st.subheader("Scraping (parallel)")
+    progress = st.progress(0.0, text=f"0 / {len(target_urls)} sites done")
+    # One row per site, filled in as each finishes (not in submission order)
+    rows = {u: st.empty() for u in target_urls}
+    for u, row in rows.items():
+        row.write(f"⏳ {u}")
+
+    results: dict = {}
+    started = time.perf_counter()
+    # Workers only scrape; all Streamlit calls stay on this script thread
+    for u, outcome in scrape_sites(
+        target_urls,
+        max_workers=len(target_urls),
+        max_pages=3,
+        max_images_total=12,
+        timeout_s=15,
+    ):
+        elapsed = time.perf_counter() - started
+        if isinstance(outcome, ScrapeResult):
+            results[u] = {
+                "visited_urls": outcome.visited_urls,
+                "scraped_text": outcome.text,
+                "image_urls": outcome.image_urls,
+                "error": "",
+                "elapsed_s": elapsed,
+            }
+            rows[u].write(f"✅ {u} — {len(outcome.visited_urls)} page(s), {elapsed:.1f}s")
+        else:
+            results[u] = {
+                "visited_urls": [],
+                "scraped_text": "",
+                "image_urls": [],
+                "error": str(outcome),
+                "elapsed_s": elapsed,
+            }
+            rows[u].write(f"❌ {u} — {outcome}")
+        progress.progress(len(results) / len(target_urls), text=f"{len(results)} / {len(target_urls)} sites done")
+
+    st.session_state["compare_results"] = results
+    # Only a total failure blocks n8n; partial results are still worth comparing
+    if all(r["error"] for r in results.values()):
+        st.session_state["compare_status"] = "error"
+    else:
+        st.session_state["compare_status"] = "scraped"
+    st.rerun()
+
+status = st.session_state.get("compare_status", "idle")
+results = st.session_state.get("compare_results", {})
+
+if status == "error":
+    st.error("All sites failed to scrape.")
+
+if results:
+    # elapsed_s is measured from the shared start, so the max is the wall-clock time
+    wall = max((r.get("elapsed_s", 0.0) for r in results.values()), default=0.0)
+    st.caption(f"Scraped {len(results)} site(s) in parallel in {wall:.1f}s.")
+
+st.divider()
+
+labels = ["Client" if i == 0 else f"Competitor {i}" for i in range(len(target_urls))]
+for tab, u in zip(st.tabs(labels), target_urls):
+    with tab:
+        site = results.get(u)
+        st.markdown(f"**{u}**")
+        if not site:
+            st.write("Not scraped yet.")
+            continue
+        if site.get("error"):
+            st.error(f"Scrape failed: {site['error']}")
+            continue
+
+        visited = site.get("visited_urls", [])
+        st.write(f"Visited {len(visited)} page(s):")
+        for v in visited:
+            st.write(f"- {v}")
+
+        text = site.get("scraped_text", "")
+        if text:
+            st.text_area("Extracted text", text, height=200, key=f"cmp_text_{u}")
+        else:
+            st.write("No text extracted.")
+
+        imgs = site.get("image_urls", [])
+        if imgs:
+            st.image(imgs[:6], caption=imgs[:6], use_container_width=True)
+        else:
+            st.write("No images extracted.")